@@ -5,15 +5,37 @@
 # @Author    : Chen.Chen
 # @software  : PyCharm
 
+import atexit
 import cv2
+import glob
+import itertools
+import numpy as np
 import os
+import re
 import time
 import logging
+import queue
+import shutil
+import struct
+import subprocess
 import sys
 import threading
-import pygame.camera
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from rich.logging import RichHandler
 
+try:
+    from turbojpeg import TurboJPEG
+except ImportError:
+    TurboJPEG = None
+
+try:
+    import PyNvVideoCodec as nvc
+    from nvidia import nvimgcodec
+except ImportError:
+    nvc = None
+    nvimgcodec = None
+
 
 def logging_init() -> None:
     """ logger初始化. """
@@ -24,6 +46,79 @@ def logging_init() -> None:
                     keywords=['Camera'], omit_repeated_times=False))
 
 
+# NVENC 硬件编码的 GStreamer 管线，appsrc 接收 OpenCV 写入的 BGR 帧，转换后交给 GPU 编码并封装为 mp4
+NVENC_PIPELINE = ("appsrc ! videoconvert ! nvh264enc preset=low-latency-hp rc-mode=vbr ! "
+                  "h264parse ! mp4mux ! filesink location=\"{location}\"")
+# 实时预览的 GStreamer 管线，颜色转换与显示交给 GPU(OpenGL) 完成
+PREVIEW_PIPELINE = "appsrc ! videoconvert ! glimagesink sync=false"
+_gstreamer_supported = None     # OpenCV 是否带 GStreamer 支持，首次探测后缓存
+_nvenc_supported = None     # NVENC 管线是否可用，首次打开 VideoWriter 后缓存
+FRAME_QUEUE_SIZE = 8    # 采集线程与编码线程之间的帧队列长度
+RAW_BUFFER_MARGIN = 1.2     # 原始帧缓冲容量相对 fps*timeout 的余量，摄像头实际帧率可能略高于标称值
+FFMPEG_H264_ENCODERS = ("h264_nvenc", "libx264")   # 延后编码时按顺序尝试的 ffmpeg 编码器
+_ffmpeg_encoders = None     # 本机 ffmpeg 可用的 H.264 编码器，首次探测后缓存
+VIDIOC_QUERYCAP = 0x80685600    # _IOR('V', 0, struct v4l2_capability)，结构体大小为 104 字节
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001     # 设备支持视频采集
+V4L2_CAP_DEVICE_CAPS = 0x80000000   # device_caps 字段有效
+MAX_PROBE_CAMERAS = 8   # 非 Linux 平台逐个尝试打开的摄像头编号数量
+_active_records = {}    # 正在进行的录像: {录像线程: USBRecord 对象}，解释器退出时用于收尾
+_warm_camera = {}   # 后台预热的摄像头，包含 index(设备编号)、thread(预热线程)、capture(VideoCapture 对象)
+JPEG_QUALITY = 85   # 视频切片输出 JPEG 的质量
+SLICE_MAX_PENDING = 64  # 视频切片时最多同时等待编码的帧数，用于限制内存占用
+GPU_SLICE_BATCH = 32    # GPU 视频切片时每批解码、编码的帧数
+HUD_HEIGHT = 170    # 实时预览叠加文字区域的高度(像素)
+HUD_COLOR = np.array([0, 0, 255], np.uint16)    # 实时预览叠加文字的颜色(BGR)
+MS_TEXTS = [f"{ms:03d}" for ms in range(1000)]     # 时间戳毫秒部分的预格式化文本
+TIMESTAMP_ALPHABET = "0123456789:."     # 时间戳文本可能出现的全部字符
+STATS_LOG_INTERVAL_NS = 5_000_000_000   # 录像期间输出帧队列深度与丢帧数的间隔(纳秒)
+# 预渲染的字形：alpha 笔画抗锯齿覆盖度(0~255)，color 文字颜色(BGR)，advance 步进宽度，origin 字形图内基线左端点坐标
+Glyph = namedtuple("Glyph", ["alpha", "color", "advance", "origin"])
+
+
+def gstreamer_available():
+    """检测当前 OpenCV 是否编译了 GStreamer 支持，结果在首次调用后缓存。"""
+    global _gstreamer_supported
+    if _gstreamer_supported is None:
+        _gstreamer_supported = re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()) is not None
+    return _gstreamer_supported
+
+
+def ffmpeg_h264_encoders():
+    """
+    返回本机 ffmpeg 支持的 H.264 编码器列表，按 FFMPEG_H264_ENCODERS 的优先级排序。
+    未安装 ffmpeg 时返回空列表，结果在首次调用后缓存。
+    """
+    global _ffmpeg_encoders
+    if _ffmpeg_encoders is None:
+        _ffmpeg_encoders = []
+        if shutil.which("ffmpeg"):
+            try:
+                output = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                        capture_output=True, text=True, check=True).stdout
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.warning(f"Failed to list ffmpeg encoders: {e}")
+            else:
+                # 每行格式形如 " V....D h264_nvenc    NVIDIA NVENC H.264 encoder"，第二列为编码器名称
+                names = {line.split()[1] for line in output.splitlines() if len(line.split()) > 1}
+                _ffmpeg_encoders = [encoder for encoder in FFMPEG_H264_ENCODERS if encoder in names]
+    return _ffmpeg_encoders
+
+
+@atexit.register
+def finish_active_records():
+    """
+    解释器退出时停止仍在进行的录像，并等待录像线程完成编码、删除原始帧缓冲文件。
+    录像线程是守护线程，若不在此等待，会在编码前被直接终止，只留下未编码的缓冲文件。
+    """
+    for thread, record in list(_active_records.items()):
+        if not thread.is_alive():
+            continue
+        logging.warning("Interpreter is exiting, stop recording and wait for the video to be saved.")
+        record.is_stop_record = True
+        record._stop_event.set()
+        thread.join()
+
+
 def create_directory():
     """在脚本同级创建命名为Picture的目录, 然后脚本每次执行时会创建新的子目录, 并以时间戳来命名"""
     main_dir = "Videos"
@@ -59,8 +154,8 @@ def start_thread(target, args):
         if not callable(target):
             logging.error(f'The incoming target argument must be a callable object!')
             sys.exit(1)
-        # 创建线程对象，并传入执行目标和参数
-        thread = threading.Thread(target=target, args=args)
+        # 创建线程对象，并传入执行目标和参数；设为守护线程，避免残留的录像线程阻塞解释器退出
+        thread = threading.Thread(target=target, args=args, daemon=True)
         thread.start()  # 启动线程
         logging.info(f"Thread start: ID={thread.ident}, Target={thread.name}")  # 记录线程启动信息
         return thread
@@ -69,33 +164,116 @@ def start_thread(target, args):
         sys.exit(1)
 
 
+def list_v4l2_cameras():
+    """
+    Linux 下扫描 /dev/video* 设备节点，通过 V4L2 的 VIDIOC_QUERYCAP 获取摄像头名称。
+    同一个 USB 摄像头通常会注册多个节点(如元数据节点)，只保留支持视频采集的节点。
+    返回值: {OpenCV 设备编号: 摄像头名称} 字典，设备编号即 /dev/videoN 中的 N。
+    """
+    import fcntl    # 仅 Linux 可用
+    cameras = {}
+    for path in glob.glob("/dev/video*"):
+        match = re.fullmatch(r"/dev/video(\d+)", path)
+        if match is None:
+            continue
+        capability = bytearray(104)
+        try:
+            fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+            try:
+                fcntl.ioctl(fd, VIDIOC_QUERYCAP, capability)
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
+        # struct v4l2_capability: driver[16], card[32], bus_info[32], version, capabilities, device_caps
+        card = capability[16:48].split(b"\0", 1)[0].decode(errors="replace")
+        capabilities, device_caps = struct.unpack_from("=II", capability, 84)
+        if capabilities & V4L2_CAP_DEVICE_CAPS:
+            capabilities = device_caps
+        if capabilities & V4L2_CAP_VIDEO_CAPTURE:
+            cameras[int(match.group(1))] = f"{card} ({path})"
+    return dict(sorted(cameras.items()))
+
+
+def probe_cameras():
+    """
+    依次尝试用 OpenCV 打开编号 0 ~ MAX_PROBE_CAMERAS-1 的摄像头。
+    使用与 open_record_camera 相同的默认后端，不同后端(如 Windows 的 DirectShow 与 MSMF)的设备编号可能不一致。
+    返回值: {OpenCV 设备编号: 摄像头名称} 字典。
+    """
+    cameras = {}
+    for index in range(MAX_PROBE_CAMERAS):
+        capture = cv2.VideoCapture(index, cv2.CAP_ANY)
+        if capture.isOpened():
+            cameras[index] = f"Camera {index}"
+        capture.release()
+    return cameras
+
+
+def warm_up_camera(index):
+    """
+    在后台线程中提前打开指定编号的摄像头，使 USB 枚举与 UVC 协商的耗时与用户输入并行。
+    预热好的摄像头通过 take_warm_camera 取出。
+    """
+    _warm_camera.clear()
+
+    def open_camera():
+        _warm_camera["capture"] = cv2.VideoCapture(index)
+
+    thread = threading.Thread(target=open_camera, name="camera_warm_up", daemon=True)
+    _warm_camera.update(index=index, thread=thread)
+    thread.start()
+
+
+def take_warm_camera(index):
+    """
+    取出 warm_up_camera 预热的摄像头。
+    没有预热、预热的编号与 index 不一致或摄像头未能打开时返回 None，并释放预热的摄像头。
+    """
+    if not _warm_camera:
+        return None
+    _warm_camera["thread"].join()
+    warm_index = _warm_camera["index"]
+    capture = _warm_camera.get("capture")
+    _warm_camera.clear()
+    if capture is None:
+        return None
+    if warm_index != index or not capture.isOpened():
+        capture.release()
+        return None
+    return capture
+
+
 def show_and_select_camera():
     """检测、显示可用摄像头，并返回手动所选择Camera的编号。
 
-    使用 pygame 来检测设备连接的摄像头列表，如果没有检测到摄像头，程序将打印提示信息并退出。
-    如果检测到摄像头，函数将打印出可用的摄像头列表和对应的 ID。
+    Linux 下直接通过 V4L2 查询 /dev/video* 设备，其他平台逐个尝试打开摄像头，
+    如果没有检测到摄像头，程序将打印提示信息并退出。
+    如果检测到摄像头，函数将打印出可用的摄像头列表和对应的 ID，ID 即 OpenCV 的设备编号。
+    等待用户输入期间会在后台预热列表中的第一个摄像头。
     """
     try:
-        pygame.camera.init()  # 初始化 pygame 的摄像头模块
-        camera_list = pygame.camera.list_cameras()  # 获取设备上的摄像头列表
+        # 获取设备上的摄像头列表，ID 到摄像头名称的映射
+        cameras = list_v4l2_cameras() if sys.platform.startswith("linux") else probe_cameras()
     except Exception as e:
-        logging.error(f"Failed to initialize cameras or list cameras: {e}")
+        logging.error(f"Failed to list cameras: {e}")
         sys.exit(1)
 
-    if not camera_list:
+    if not cameras:
         logging.error("Do not find any cameras.")
         sys.exit(1)
 
-    cameras = dict(enumerate(camera_list))  # 创建 ID 到摄像头名称的映射
-    cameras_num = len(cameras)
-    logging.info(f"Available Cameras as follow, Please choose one: (range: [0-{cameras_num - 1}])")
+    camera_ids = list(cameras)
+    logging.info(f"Available Cameras as follow, Please choose one: (range: {camera_ids})")
     logging.info('{:=>50}'.format(''))
     for id, dev in cameras.items():
         logging.info(f"{id} : {dev}")
     logging.info('{:=>50}'.format(''))
 
-    index = int(input(f'Please select the camera index from [0-{cameras_num - 1}]:'))
-    if 0 <= index < cameras_num:
+    # 用户选择期间预热最可能被选中的第一个摄像头
+    warm_up_camera(camera_ids[0])
+    index = int(input(f'Please select the camera index from {camera_ids}:'))
+    if index in cameras:
         camera = cameras[index]
         logging.info(f'You selection is: [ {index}: {camera} ]')
         return index
@@ -122,28 +300,175 @@ def format_time(times):
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
 
 
-def draw_timestamp(frame, timestamp_text):
+def build_glyph_atlas(alphabet, font_scale=1, font_color=(255, 255, 255), thickness=2):
+    """
+    为字符集中的每个字符预先渲染一次字形并记录每个像素的覆盖度，之后绘制文本时只需按覆盖度混合颜色，不再逐帧光栅化。
+    参数:
+    alphabet: str - 需要渲染的字符集合。
+    font_scale, font_color, thickness - 与 cv2.putText 的同名参数含义一致，字体固定为 FONT_HERSHEY_SIMPLEX。
+    返回值:
+    dict - {字符: Glyph}，所有字形高度一致，四周留出 thickness 像素的边距以容纳笔画。
+    """
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    (_, text_height), baseline = cv2.getTextSize(alphabet, font, font_scale, thickness)
+    origin = (thickness, thickness + text_height)
+    color = np.array(font_color, np.uint16)
+    # putText 会对笔画边缘做抗锯齿，黑底上各通道的强度与覆盖度成正比，用最大通道换算为 0~255 的覆盖度
+    color_max = max(int(color.max()), 1)
+    glyphs = {}
+    for char in alphabet:
+        # getTextSize 的宽度包含笔画粗细，用两个字符与一个字符的宽度差得到真实步进
+        (width, _), _ = cv2.getTextSize(char, font, font_scale, thickness)
+        advance = cv2.getTextSize(char * 2, font, font_scale, thickness)[0][0] - width
+        image = np.zeros((text_height + baseline + 2 * thickness, width + 2 * thickness, 3), np.uint8)
+        cv2.putText(image, char, origin, font, font_scale, font_color, thickness)
+        alpha = (image.max(axis=2, keepdims=True).astype(np.uint16) * 255 + color_max // 2) // color_max
+        glyphs[char] = Glyph(alpha, color, advance, origin)
+    return glyphs
+
+
+def draw_glyphs(frame, text, text_origin, glyphs):
+    """
+    使用预渲染的字形表在帧上绘制文本。
+    参数:
+    frame: numpy.ndarray - 输入的视频帧，直接在此帧上绘制。
+    text: str - 要绘制的文本，所有字符必须在字形表中。
+    text_origin: tuple - 文本左下角(基线)坐标，与 cv2.putText 的 org 参数一致。
+    glyphs: dict - build_glyph_atlas 生成的字形表。
+    """
+    frame_height, frame_width = frame.shape[:2]
+    x, y = text_origin
+    for char in text:
+        glyph = glyphs[char]
+        left = x - glyph.origin[0]
+        top = y - glyph.origin[1]
+        x += glyph.advance
+        height, width = glyph.alpha.shape[:2]
+        # 字形按帧的四条边裁剪，超出部分不绘制，与 cv2.putText 的裁剪效果一致
+        glyph_top, glyph_left = max(0, -top), max(0, -left)
+        glyph_bottom = min(height, frame_height - top)
+        glyph_right = min(width, frame_width - left)
+        if glyph_top >= glyph_bottom or glyph_left >= glyph_right:
+            continue
+        # 按覆盖度把文字颜色混合到帧上，与 cv2.putText 抗锯齿边缘的效果一致
+        roi = frame[top + glyph_top:top + glyph_bottom, left + glyph_left:left + glyph_right]
+        alpha = glyph.alpha[glyph_top:glyph_bottom, glyph_left:glyph_right]
+        roi[:] = (roi * (255 - alpha) + glyph.color * alpha + 127) // 255
+
+
+def draw_timestamp(frame, timestamp_text, glyphs):
     """
     在给定的帧上绘制时间戳文本。
     参数:
     frame: numpy.ndarray - 输入的视频帧，将在此帧上绘制时间戳。
     timestamp_text: str - 要绘制在帧上的时间戳文本。
+    glyphs: dict - 时间戳字符的字形表，由 build_glyph_atlas(TIMESTAMP_ALPHABET) 生成。
     返回值:
     无。此函数直接在输入的frame上绘制文本并修改它。
     """
-    # 设定字体和字体大小
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 1
-    # 设定字体颜色和线条类型
-    font_color = (255, 255, 255)
-    line_type = 2
-    # # 计算文本大小，以便正确地在帧上定位它
-    # text_size, _ = cv2.getTextSize(timestamp_text, font, font_scale, line_type)
     # 确保性能，直接定死文字位置
     text_origin = (10, 30)
-    # text_origin = (10, 10 + text_size[1])
-    # 在帧上绘制时间戳文本
-    cv2.putText(frame, timestamp_text, text_origin, font, font_scale, font_color, line_type)
+    # 在帧上拷贝预渲染的字形，避免每帧调用 cv2.putText 光栅化字体
+    draw_glyphs(frame, timestamp_text, text_origin, glyphs)
+
+
+def frame_paths(path_prefix):
+    """
+    依次生成视频切片图像的路径 <path_prefix><帧计数>.jpg，帧计数从 0 开始。
+    路径由 map 与 itertools 在 C 层拼接，切片循环内只需 next() 取下一条路径。
+    """
+    return map("{}{}.jpg".format, itertools.repeat(path_prefix), itertools.count())
+
+
+def create_jpeg_encoder():
+    """
+    创建 TurboJPEG 编码器，整个视频切片过程复用同一个实例，使用 libjpeg-turbo 的 SIMD 编码。
+    未安装 PyTurboJPEG 或找不到 libturbojpeg 动态库时返回 None，由调用方回退到 cv2.imencode。
+    """
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError) as e:
+        logging.warning(f"Failed to load libturbojpeg, fall back to OpenCV JPEG encoder: {e}")
+        return None
+
+
+def save_jpeg(path, frame, jpeg_encoder=None):
+    """
+    将帧编码为 JPEG 并写入指定路径。
+    jpeg_encoder 为 create_jpeg_encoder 返回的 TurboJPEG 实例，为 None 时使用 cv2.imencode。
+    两种编码器编码时都会释放 GIL，可在多个线程中并行执行；
+    直接写入原始字节，同时支持包含中文的路径。
+    """
+    if jpeg_encoder is not None:
+        # TurboJPEG 默认输入像素格式即为 BGR
+        buffer = jpeg_encoder.encode(frame, quality=JPEG_QUALITY)
+        with open(path, 'wb') as f:
+            f.write(buffer)
+        return
+    ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+    if not ret:
+        logging.warning(f"Failed to encode frame: {path}")
+        return
+    buffer.tofile(path)
+
+
+class CudaVideoReader:
+    """
+    基于 cv2.cudacodec 的视频读取器，在 GPU(NVDEC) 上完成码流解析与解码，
+    接口与 cv2.VideoCapture 的 read/isOpened/release 保持一致，便于替换。
+    """
+
+    def __init__(self, filename):
+        self.reader = cv2.cudacodec.createVideoReader(filename)
+        # OpenCV 4.7 及以上可请求直接输出 BGR，旧版本固定输出 BGRA；
+        # set 的返回值在不同版本中不可靠，是否需要转换在 read 中按实际通道数判断
+        try:
+            self.reader.set(cv2.cudacodec.ColorFormat_BGR)
+        except (AttributeError, cv2.error):
+            pass
+        # 预先解码第一帧，NVDEC 无法解码该视频时在打开阶段就抛出异常，由调用方回退到 CPU 解码
+        ret, frame = self._read_frame()
+        if not ret:
+            raise RuntimeError("NVDEC failed to decode the first frame")
+        self.first_frame = frame
+
+    def isOpened(self):
+        return self.reader is not None
+
+    def _read_frame(self):
+        ret, gpu_frame = self.reader.nextFrame()
+        if not ret:
+            return False, None
+        if gpu_frame.channels() == 4:
+            gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+        # 帧会交给线程池异步编码，需要下载到独立的内存中
+        return True, gpu_frame.download()
+
+    def read(self):
+        if self.first_frame is not None:
+            frame, self.first_frame = self.first_frame, None
+            return True, frame
+        return self._read_frame()
+
+    def release(self):
+        self.reader = None
+
+
+def open_video_reader(filename):
+    """
+    打开视频文件用于逐帧解码。
+    OpenCV 编译了 cudacodec 且存在 CUDA 设备时使用 GPU 解码，否则回退到 cv2.VideoCapture 的 CPU 解码。
+    """
+    if hasattr(cv2, "cudacodec") and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+        try:
+            reader = CudaVideoReader(filename)
+            logging.info("Use NVDEC hardware decoder for video slice.")
+            return reader
+        except (cv2.error, RuntimeError) as e:
+            logging.warning(f"Failed to open video with cudacodec, fall back to CPU decoder: {e}")
+    return cv2.VideoCapture(filename)
 
 
 class USBRecord:
@@ -168,21 +493,48 @@ class USBRecord:
         self.act_frame_height = None  # 实际帧高度，初始化为None，使用时会根据摄像头的实际能力进行设置
         self.act_frame_fps = None  # 实际帧率，初始化为None，使用时会根据摄像头的实际能力进行设置
         self.record_mark = is_record_mark  # 是否enable录像时间戳
-        self.start_mark_time = None  # 记录开始标记的时间，初始化为None，当开始记录时设置
+        self.start_mark_time = None  # 记录开始标记的时间(time.monotonic_ns，纳秒)，初始化为None，当开始记录时设置
         self.record_name = None     # 视频名称，初始化为None
         self.filename = None     # 完整录像路径+文件名，初始化为None
         self.save_path = None   # 初始化保存路径，初始化为None
+        self._frame_q = queue.Queue(maxsize=FRAME_QUEUE_SIZE)   # 采集线程 -> 编码线程的帧队列
+        self._free_frames = queue.SimpleQueue()     # 编码线程用完后归还、可供采集线程复用的帧缓冲
+        self._frame_buf = None  # 实时预览复用的帧缓冲，打开摄像头后按实际分辨率分配
+        self._raw_frames = None     # 录像期间存放原始 BGR 帧的预分配缓冲(np.memmap)，采集结束后再编码
+        self._stop_event = threading.Event()    # 停止采集事件
+        self._dropped = 0   # 因编码跟不上而被丢弃的帧数
+        self._hud_pixels = None     # 实时预览静态文字覆盖的像素坐标 (行, 列)，打开摄像头后生成
+        self._hud_alpha = None  # 上述像素的抗锯齿覆盖度(0~255)
+        self._ts_second = None  # 上一次格式化时间戳的整秒数
+        self._ts_prefix = None  # 上一次格式化时间戳的 HH:MM:SS. 前缀
+        self._glyphs = build_glyph_atlas(TIMESTAMP_ALPHABET)    # 时间戳字形表
+
+    @property
+    def queue_depth(self):
+        """采集线程与写入线程之间帧队列中当前等待的帧数。"""
+        return self._frame_q.qsize()
+
+    @property
+    def dropped_frames(self):
+        """本次录像中被丢弃的帧数。"""
+        return self._dropped
 
     def open_record_camera(self):
         """尝试打开摄像头并设置分辨率与帧率。"""
         try:
-            self.camera = cv2.VideoCapture(self.device_index)
-            if not self.camera.isOpened():
-                self.camera.open(self.device_index)
+            # 优先使用选择摄像头时已在后台预热的摄像头，此时摄像头已完成初始化，无需再等待
+            self.camera = take_warm_camera(self.device_index)
+            if self.camera is None:
+                self.camera = cv2.VideoCapture(self.device_index)
+                if not self.camera.isOpened():
+                    self.camera.open(self.device_index)
 
-            # 增加延时保护
-            time.sleep(1)
+                # 增加延时保护
+                time.sleep(1)
 
+            # 优先请求 MJPEG 格式，由摄像头硬件压缩，USB 带宽占用远小于默认的 YUYV，高分辨率下才能跑满帧率
+            # 需要在设置分辨率与帧率之前设置
+            self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*'MJPG'))
             # 设置摄像头分辨率
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_resolution[0])
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_resolution[1])
@@ -194,48 +546,131 @@ class USBRecord:
             self.act_frame_width = int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
             self.act_frame_height = int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
             self.act_frame_fps = int(self.camera.get(cv2.CAP_PROP_FPS))
+            # 获取摄像头实际使用的像素格式，fourcc 为小端序的 4 个字符
+            # MSMF、DSHOW 等后端不报告像素格式，此时 fourcc 为 0
+            fourcc = int(self.camera.get(cv2.CAP_PROP_FOURCC)) & 0xFFFFFFFF
+            act_fourcc = fourcc.to_bytes(4, "little").decode("ascii", errors="replace") if fourcc else "unknown"
             logging.info(
                 f"Current Camera with configuration: "
                 f"index: {self.device_index}, resolution: {self.act_frame_width}x{self.act_frame_height}, "
-                f"frame rate: {self.act_frame_fps}fps")
+                f"frame rate: {self.act_frame_fps}fps, format: {act_fourcc}")
+            if fourcc and act_fourcc != "MJPG":
+                logging.warning(f"Camera does not accept MJPG format, using {act_fourcc} instead.")
+            self._frame_buf = np.empty((self.act_frame_height, self.act_frame_width, 3), np.uint8)
+            self._build_hud()
         except Exception as e:
             logging.error(f"Failed to open the camera: {e}")
 
-    def show_live_camera(self, timeout=60):
+    def _build_hud(self):
+        """
+        预先把实时预览中不变的文字(Camera ID、帧信息、退出提示)绘制到一张叠加图上，
+        记录文字覆盖的像素及其抗锯齿覆盖度，预览时只需对这些像素按覆盖度混合文字颜色，
+        效果与直接 putText(LINE_AA) 一致，每帧只剩倒计时一处需要 putText。
+        """
+        hud = np.zeros((min(HUD_HEIGHT, self.act_frame_height), self.act_frame_width, 3), np.uint8)
+        cv2.putText(hud, f'Camera ID: {self.device_index}', (25, 40),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2, cv2.LINE_AA)
+        cv2.putText(hud, f"Frame Info: "
+                         f"{self.act_frame_width}x{self.act_frame_height}@{self.act_frame_fps}fps", (25, 80),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 1, cv2.LINE_AA)
+        cv2.putText(hud, f'Enter "q" to close windows', (25, 160),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 1, cv2.LINE_AA)
+        # 文字为纯红色，红色通道即为抗锯齿覆盖度
+        coverage = hud[:, :, 2]
+        self._hud_pixels = np.nonzero(coverage)
+        self._hud_alpha = coverage[self._hud_pixels].astype(np.uint16)[:, None]
+
+    def show_live_camera(self, timeout=60, use_gst_preview=False):
         """
         检测指定 camera 状态，并有 60 秒画面出图，进行镜头位置调整
+        :param timeout: 预览时长(秒)，默认为60秒。
+        :param use_gst_preview: 是否把画面输出到 GStreamer glimagesink，适用于 CPU 较弱的嵌入式平台，默认为False。
+            glimagesink 窗口无法通过 "q" 键关闭，只能等待倒计时结束；不可用时回退到 cv2.imshow。
         :return: None
         """
-        start_time = time.time()
+        preview_sink = self._open_preview_sink() if use_gst_preview else None
+        # 不变的文字已预先绘制在叠加图中，倒计时文本只在剩余秒数变化时重新格式化
+        countdown_clock = None
+        last_remaining_time = None
+        # 使用单调时钟的整数纳秒计时，不受系统时间调整影响，也避免每帧创建浮点数
+        timeout_ns = int(timeout * 1_000_000_000)
+        start_ns = time.monotonic_ns()
         while True:
             # 计算剩余的倒计时时间，使用 60 进制
-            elapsed_time = time.time() - start_time
-            remaining_time = max(0, int(timeout - elapsed_time))
-            remaining_minute = remaining_time // 60
-            remaining_second = remaining_time % 60
-            countdown_clock = f"Countdown Clock: {remaining_minute:02d}:{remaining_second:02d}"
-            # 读取图像
-            ret, frame = self.camera.read()
+            elapsed_ns = time.monotonic_ns() - start_ns
+            remaining_time = max(0, (timeout_ns - elapsed_ns) // 1_000_000_000)
+            if remaining_time != last_remaining_time:
+                last_remaining_time = remaining_time
+                remaining_minute = remaining_time // 60
+                remaining_second = remaining_time % 60
+                countdown_clock = f"Countdown Clock: {remaining_minute:02d}:{remaining_second:02d}"
+            # 读取图像，解码到预先分配的缓冲中，避免每帧重新分配内存
+            ret = self.camera.grab()
+            if ret:
+                ret, frame = self.camera.retrieve(self._frame_buf)
             if not ret:     # 判断是否可以收到 camera frame，不能接收报错退出
                 self.camera.release()
                 logging.error(f"Can not receive camera_id:{self.device_index} frame")
                 sys.exit(1)
-            # 在帧上添加文本
-            cv2.putText(frame, f'Camera ID: {self.device_index}', (25, 40),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2, cv2.LINE_AA)
-            cv2.putText(frame, f"Frame Info: "
-                               f"{self.act_frame_width}x{self.act_frame_height}@{self.act_frame_fps}fps", (25, 80),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 1, cv2.LINE_AA)
+            # 在帧上添加文本：静态文字只对预先记录的像素按覆盖度混合红色，只有倒计时每帧绘制
+            pixels = frame[self._hud_pixels].astype(np.uint16)
+            frame[self._hud_pixels] = ((pixels * (255 - self._hud_alpha) + HUD_COLOR * self._hud_alpha + 127)
+                                       // 255).astype(np.uint8)
             cv2.putText(frame, countdown_clock, (25, 120),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 1, cv2.LINE_AA)
-            cv2.putText(frame, f'Enter "q" to close windows', (25, 160),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 1, cv2.LINE_AA)
-            cv2.imshow('frame', frame)
+            if preview_sink is not None:
+                preview_sink.write(frame)
+            else:
+                cv2.imshow('frame', frame)
             # 时间超时关闭
-            if cv2.waitKey(1) == ord('q') or elapsed_time > timeout:
+            if cv2.waitKey(1) == ord('q') or elapsed_ns > timeout_ns:
                 break
-        cv2.destroyAllWindows()
-        cv2.waitKey(1)
+        if preview_sink is not None:
+            preview_sink.release()
+        else:
+            cv2.destroyAllWindows()
+            cv2.waitKey(1)
+
+    def _open_preview_sink(self):
+        """
+        创建 GStreamer glimagesink 预览输出，由 GPU 完成颜色转换与显示，降低嵌入式平台上的 CPU 占用。
+        OpenCV 不支持 GStreamer 或管线无法打开时返回 None，由调用方使用 cv2.imshow。
+        """
+        if not gstreamer_available():
+            return None
+        preview_sink = cv2.VideoWriter(PREVIEW_PIPELINE, cv2.CAP_GSTREAMER, 0, self.act_frame_fps,
+                                       (self.act_frame_width, self.act_frame_height))
+        if not preview_sink.isOpened():
+            preview_sink.release()
+            logging.warning("GStreamer preview pipeline is unavailable, fall back to OpenCV window.")
+            return None
+        # glimagesink 窗口不经过 HighGUI，无法通过 "q" 键关闭，只能等待倒计时结束
+        logging.info("Use GStreamer glimagesink for live preview, the window closes when the countdown ends.")
+        return preview_sink
+
+    def _open_video_writer(self):
+        """
+        创建编码用的 VideoWriter，在本机没有可用的 ffmpeg 时用于编码原始帧缓冲。
+        优先使用 GStreamer + nvh264enc 的 NVENC 硬件编码(H.264, mp4)，把编码从 CPU 卸载到 GPU；
+        OpenCV 不支持 GStreamer 或管线无法打开时，回退到 XVID 软件编码(avi)。
+        返回值: (writer, filename) 元组。
+        """
+        global _nvenc_supported
+        frame_size = (self.act_frame_width, self.act_frame_height)
+        if _nvenc_supported is not False and gstreamer_available():
+            filename = os.path.join(self.save_path, f"{self.record_name}.mp4")
+            writer = cv2.VideoWriter(NVENC_PIPELINE.format(location=filename), cv2.CAP_GSTREAMER, 0,
+                                     self.act_frame_fps, frame_size)
+            _nvenc_supported = writer.isOpened()
+            if _nvenc_supported:
+                logging.info("Use NVENC hardware encoder for recording.")
+                return writer, filename
+            writer.release()
+            logging.warning("NVENC pipeline is unavailable, fall back to XVID encoder.")
+        filename = os.path.join(self.save_path, f"{self.record_name}.avi")
+        fourcc = cv2.VideoWriter.fourcc(*'XVID')
+        writer = cv2.VideoWriter(filename, fourcc, self.act_frame_fps, frame_size)
+        return writer, filename
 
     def start_record(self, save_path=None, test_case_name=None, count=None, timeout=60):
         """
@@ -245,54 +680,237 @@ class USBRecord:
         - test_case_name: 用以区分不同测试案例的名称
         - count: 用于区分同一测试案例下不同视频的计数器
         - timeout: 录制视频的最长时间（秒），默认为60秒。
+        录制期间原始帧写入预分配的缓冲文件，采集结束后再统一编码为视频文件并删除缓冲文件。
         无返回值
         """
         # 初始化录像标志，record_mark是视频时间戳；is_stop_record是停止录像标志
         self.record_mark = False
         self.is_stop_record = False
         self.save_path = save_path
+        self.filename = None    # 录像编码完成后才设置，避免视频切片误用上一次的录像
         # 检查摄像头是否打开，如果未打开，则尝试打开
         if self.camera is None or not self.camera.isOpened():
             logging.warning("Camera is not opened. Trying to open it...")
             self.open_record_camera()
+        # 登记当前录像，解释器退出时由 finish_active_records 停止录像并等待编码完成
+        record_thread = threading.current_thread()
+        _active_records[record_thread] = self
         try:
             # 获取当前时间，用于生成文件名
             now_time = time.strftime("%Y%m%d_%H%M%S")
             self.record_name = f"{test_case_name}_{now_time}_{count}"
-            # 拼接路径和文件名
-            self.filename = os.path.join(self.save_path, f"{self.record_name}.avi")
-            # 创建VideoWriter对象，用于写入视频文件
-            fourcc = cv2.VideoWriter.fourcc(*'XVID')
-            writer = cv2.VideoWriter(self.filename, fourcc,
-                                     self.act_frame_fps, (self.act_frame_width, self.act_frame_height))
-            # 定义录像其实时间，用于计算录像总时长
+            # 录制期间只把原始帧拷贝到预分配的缓冲文件中，编码延后到采集结束之后，避免编码抢占 CPU 导致丢帧
+            capacity = int(self.act_frame_fps * timeout * RAW_BUFFER_MARGIN) + 1
+            # 缓冲文件按最长录制时间预分配，先确认磁盘剩余空间足够，避免录制中途写满磁盘
+            required_bytes = capacity * self.act_frame_height * self.act_frame_width * 3
+            free_bytes = shutil.disk_usage(self.save_path).free
+            if free_bytes < required_bytes:
+                logging.error(f"Not enough disk space for the raw frame buffer: "
+                              f"{required_bytes / 2 ** 30:.1f} GiB required, {free_bytes / 2 ** 30:.1f} GiB free "
+                              f"in {self.save_path}. Reduce the timeout or free up disk space.")
+                return
+            raw_path = os.path.join(self.save_path, f"{self.record_name}.raw")
+            self._raw_frames = np.memmap(raw_path, dtype=np.uint8, mode='w+',
+                                         shape=(capacity, self.act_frame_height, self.act_frame_width, 3))
+            # 采集与写入拆分到两个线程：采集线程只负责读帧入队，当前线程负责出队、加时间戳并写入缓冲
             logging.info(f"Start recording")
-            start_time = time.time()
-            while True:
-                # 读取摄像头的帧
-                ret, frame = self.camera.read()
-                if ret:
-                    # enable时间戳，每帧添加时间戳
-                    if self.record_mark:
-                        if self.start_mark_time is None:
-                            self.start_mark_time = time.time()
-                        current_time = time.time() - self.start_mark_time
-                        timestamp_text = format_time(int(current_time * 1000))
-                        draw_timestamp(frame, timestamp_text)
-                    # 将帧写入输出文件
-                    writer.write(frame)
-                    # 获取当前时间并计算录制时间
-                    current_time = time.time()
-                    elapsed_time = current_time - start_time
-                    # 如果 is.stop_record标志为True或录制时间超过设定值，停止录制
-                    if self.is_stop_record or elapsed_time >= timeout:
-                        logging.info(f"Stop record")
-                        logging.info(f"Video saved as: {test_case_name}_{now_time}_{count}.avi")
-                        break
-                else:
-                    logging.warning("Failed to capture image from camera.")
+            self._frame_q = queue.Queue(maxsize=FRAME_QUEUE_SIZE)  # 每次录像使用新队列，避免残留上次的帧
+            self._free_frames = queue.SimpleQueue()
+            self._stop_event.clear()
+            self._dropped = 0
+            grab_thread = threading.Thread(target=self._grab_loop, args=(timeout,), name="grab_loop")
+            grab_thread.start()
+            try:
+                frame_count = self._write_loop()
+            finally:
+                # 写入线程异常退出时也要停止采集线程
+                self._stop_event.set()
+                grab_thread.join()
+            logging.info(f"Stop record")
+            if self._dropped:
+                logging.warning(f"Dropped {self._dropped} frames during recording.")
+            # 采集结束后再统一编码
+            self.filename = self._encode_raw_frames(frame_count)
+            logging.info(f"Video saved as: {os.path.basename(self.filename)}")
         except Exception as e:
             logging.error(f"Error capturing and saving image: {e}")
+        finally:
+            self._release_raw_frames()
+            _active_records.pop(record_thread, None)
+
+    def _encode_raw_frames(self, frame_count):
+        """
+        将原始帧缓冲中的前 frame_count 帧编码为视频文件，返回完整录像路径+文件名。
+        优先通过管道交给 ffmpeg 编码(h264_nvenc 硬件编码，其次 libx264)并封装为 mp4；
+        本机没有 ffmpeg 或 ffmpeg 编码均失败时，回退到 OpenCV 的 VideoWriter。
+        """
+        frames = self._raw_frames[:frame_count]
+        logging.info(f"Encoding {frame_count} recorded frames...")
+        filename = os.path.join(self.save_path, f"{self.record_name}.mp4")
+        for encoder in ffmpeg_h264_encoders():
+            if self._encode_with_ffmpeg(frames, encoder, filename):
+                return filename
+        writer, filename = self._open_video_writer()
+        try:
+            for frame in frames:
+                writer.write(frame)
+        finally:
+            # 释放 writer，mp4 封装需要在此时写入文件尾
+            writer.release()
+        return filename
+
+    def _encode_with_ffmpeg(self, frames, encoder, filename):
+        """
+        通过标准输入把原始 BGR 帧写给 ffmpeg 子进程编码。
+        参数:
+        - frames: 原始帧数组，形状为 (帧数, 高, 宽, 3)
+        - encoder: ffmpeg 编码器名称
+        - filename: 输出文件路径
+        返回值: 编码成功返回 True，否则返回 False。
+        """
+        command = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+                   "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{self.act_frame_width}x{self.act_frame_height}",
+                   "-r", str(self.act_frame_fps), "-i", "-",
+                   "-c:v", encoder, "-pix_fmt", "yuv420p", filename]
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            # 原始帧缓冲中的每一帧都是 C 连续的，直接写入其内存视图，不经过 tobytes 拷贝
+            for frame in frames:
+                process.stdin.write(frame.data)
+            process.stdin.close()
+        except BrokenPipeError:
+            # ffmpeg 提前退出，错误信息从 stderr 中读取
+            pass
+        error = process.stderr.read().decode(errors="replace").strip()
+        if process.wait() != 0:
+            logging.warning(f"ffmpeg failed to encode with {encoder}: {error}")
+            return False
+        logging.info(f"Use ffmpeg {encoder} encoder for recording.")
+        return True
+
+    def _release_raw_frames(self):
+        """释放原始帧缓冲并删除对应的临时文件。"""
+        if self._raw_frames is None:
+            return
+        raw_path = self._raw_frames.filename
+        self._raw_frames = None
+        try:
+            os.remove(raw_path)
+        except OSError as e:
+            logging.warning(f"Failed to remove raw frame buffer {raw_path}: {e}")
+
+    def _put_frame(self, item):
+        """
+        非阻塞地将帧放入队列。
+        队列已满时丢弃最旧的一帧并计数，保证采集线程不会被编码阻塞。
+        """
+        try:
+            self._frame_q.put_nowait(item)
+        except queue.Full:
+            try:
+                dropped_frame, _ = self._frame_q.get_nowait()
+                self._free_frames.put(dropped_frame)
+                self._dropped += 1
+            except queue.Empty:
+                pass
+            self._frame_q.put_nowait(item)
+
+    def _grab_loop(self, timeout):
+        """
+        采集线程：循环读取摄像头帧并入队，直到收到停止信号或录制时间超过 timeout。
+        入队元素为 (frame, timestamp_ms)，timestamp_ms 为帧采集时刻的时间戳毫秒数，未 enable 时间戳时为 None。
+        结束时放入 None 作为哨兵，通知编码线程退出。
+        帧缓冲优先复用编码线程归还的数组，只有在编码线程未及时归还时才分配新的缓冲。
+        """
+        # 使用单调时钟的整数纳秒计时，不受系统时间调整影响，也避免每帧创建浮点数
+        warned_strided = False  # 是否已对非 C 连续帧输出过警告
+        timeout_ns = int(timeout * 1_000_000_000)
+        start_ns = time.monotonic_ns()
+        try:
+            while not self._stop_event.is_set():
+                # 读取摄像头的帧，没有可复用的缓冲时 retrieve 会自动分配
+                try:
+                    frame_buf = self._free_frames.get_nowait()
+                except queue.Empty:
+                    frame_buf = None
+                ret = self.camera.grab()
+                if ret:
+                    ret, frame = self.camera.retrieve(frame_buf)
+                if not ret:
+                    if frame_buf is not None:
+                        self._free_frames.put(frame_buf)
+                    logging.warning("Failed to capture image from camera.")
+                    continue
+                # 后续绘制时间戳、拷贝进原始帧缓冲都依赖帧为 C 连续布局；retrieve 输出的帧总是连续的。
+                # 以后引入裁剪等跨步视图时这里会产生整帧拷贝，首次出现时输出警告，避免拷贝被悄悄引入
+                if not frame.flags['C_CONTIGUOUS']:
+                    if not warned_strided:
+                        warned_strided = True
+                        logging.warning("Captured frame is not C-contiguous, "
+                                        "every frame is copied before writing.")
+                    frame = np.ascontiguousarray(frame)
+                # 每帧只读取一次时钟，同时用于时间戳与录制时长判断
+                now_ns = time.monotonic_ns()
+                # enable时间戳，记录帧的采集时刻，由编码线程绘制
+                timestamp_ms = None
+                if self.record_mark:
+                    if self.start_mark_time is None:
+                        self.start_mark_time = now_ns
+                    timestamp_ms = (now_ns - self.start_mark_time) // 1_000_000
+                self._put_frame((frame, timestamp_ms))
+                # 如果 is.stop_record标志为True或录制时间超过设定值，停止录制
+                if self.is_stop_record or now_ns - start_ns >= timeout_ns:
+                    break
+        finally:
+            # 采集线程异常退出时也要放入哨兵，避免编码线程一直等待
+            self._put_frame(None)
+
+    def _write_loop(self):
+        """
+        写入线程：从队列取帧，按需绘制时间戳后拷贝到原始帧缓冲，收到 None 哨兵时退出。
+        缓冲写满后的帧计入丢帧数。录像期间每隔 STATS_LOG_INTERVAL_NS 输出一次帧队列深度与丢帧数，
+        便于发现写入跟不上采集的问题。
+        返回值: 写入缓冲的帧数。
+        """
+        frame_count = 0
+        overflow = 0
+        capacity = len(self._raw_frames)
+        next_stats_ns = time.monotonic_ns() + STATS_LOG_INTERVAL_NS
+        while True:
+            item = self._frame_q.get()
+            if item is None:
+                break
+            now_ns = time.monotonic_ns()
+            if now_ns >= next_stats_ns:
+                next_stats_ns = now_ns + STATS_LOG_INTERVAL_NS
+                logging.info(f"Frame queue depth: {self.queue_depth}, "
+                             f"dropped frames: {self.dropped_frames + overflow}")
+            frame, timestamp_ms = item
+            if timestamp_ms is not None:
+                draw_timestamp(frame, self._timestamp_text(timestamp_ms), self._glyphs)
+            # 将帧拷贝到原始帧缓冲，拷贝完归还帧缓冲供采集线程复用
+            if frame_count < capacity:
+                self._raw_frames[frame_count] = frame
+                frame_count += 1
+            else:
+                overflow += 1
+            self._free_frames.put(frame)
+        if overflow:
+            # 收到哨兵时采集线程已结束，此时累加丢帧数不会与采集线程冲突
+            self._dropped += overflow
+            logging.warning(f"Raw frame buffer is full, {overflow} frames are dropped.")
+        return frame_count
+
+    def _timestamp_text(self, timestamp_ms):
+        """
+        将时间戳毫秒数格式化为 HH:MM:SS.xxx，结果与 format_time 一致。
+        同一秒内的帧复用缓存的 HH:MM:SS. 前缀，每帧只需拼接预格式化的毫秒文本。
+        """
+        seconds, ms = divmod(timestamp_ms, 1000)
+        if seconds != self._ts_second:
+            self._ts_second = seconds
+            self._ts_prefix = format_time(seconds * 1000)[:-3]
+        return self._ts_prefix + MS_TEXTS[ms]
 
     def start_time_mark(self):
         """
@@ -308,13 +926,14 @@ class USBRecord:
 
     def stop_record(self, target):
         """
-        停止录像函数，并停止录像线程。
+        停止录像函数，并停止录像线程。录像线程会在采集结束后完成编码，因此本函数返回时视频文件已生成。
         参数:
         - target: 目标线程对象，需要停止录像的线程。
         - is_stop_record: 一个布尔值，指定是否停止记录。默认为True。
         返回值: 无
         """
         self.is_stop_record = True  # 更新停止录像标志为 True
+        self._stop_event.set()  # 通知采集线程停止
         try:
             target.join()   # 尝试加入目标线程，等待其完成
             # 记录线程关闭信息
@@ -330,37 +949,118 @@ class USBRecord:
         """
         从视频中逐帧提取图像并保存到指定目录。
         方法会为每个帧创建一个JPEG图像文件，文件名包含帧计数器的值。
+        按以下顺序选择切片方式，前一种不可用或失败时回退到下一种:
+        1. 安装了 PyNvVideoCodec 与 nvImageCodec 时，解码与 JPEG 编码全部在 GPU 上完成；
+        2. 安装了 ffmpeg 时，由 ffmpeg 一次完成解码与 JPEG 编码；
+        3. OpenCV 逐帧解码、线程池编码。
         参数:
         - self: 类实例，需要包含视频文件名（self.filename）和记录名称（self.record_name）。
         返回值: 无
         """
-        frame_capture = None    # 初始化视频帧捕获对象
+        # 没有成功生成的录像时直接退出，与打开视频文件失败的处理一致
+        if self.filename is None:
+            logging.error("Failed to open video file.")
+            sys.exit(1)
         # 创建子记录目录
         sub_record_dir_path = str(os.path.join(self.save_path, self.record_name))
         if not os.path.exists(sub_record_dir_path):
             os.makedirs(sub_record_dir_path)
-        # 初始化帧计数器
-        frame_count = 0
+        # 预先拼好文件名前缀，只需再填入帧计数
+        path_prefix = os.path.join(sub_record_dir_path, f"{self.record_name}_frame_count_")
+        if nvc is not None and self._slice_on_gpu(path_prefix):
+            logging.info(f"Record has been sliced: {sub_record_dir_path}")
+            return
+        if shutil.which("ffmpeg") and self._slice_with_ffmpeg(path_prefix):
+            logging.info(f"Record has been sliced: {sub_record_dir_path}")
+            return
+        if self._slice_with_opencv(path_prefix):
+            logging.info(f"Record has been sliced: {sub_record_dir_path}")
+
+    def _slice_on_gpu(self, path_prefix):
+        """
+        在 GPU 上完成整个切片流程：PyNvVideoCodec(NVDEC) 解码得到显存中的 RGB 帧，
+        直接交给 nvImageCodec(nvJPEG) 按批编码为 JPEG，帧数据不经过主机内存，只把编码结果写盘。
+        返回值: 成功返回 True，否则返回 False。
+        """
+        try:
+            decoder = nvc.SimpleDecoder(self.filename, gpu_id=0, use_device_memory=True,
+                                        output_color_type=nvc.OutputColorType.RGB)
+            encoder = nvimgcodec.Encoder()
+            params = nvimgcodec.EncodeParams(quality=JPEG_QUALITY)
+            paths = frame_paths(path_prefix)
+            while True:
+                frames = decoder.get_batch_frames(GPU_SLICE_BATCH)
+                if not frames:
+                    break
+                images = [nvimgcodec.as_image(frame) for frame in frames]
+                for data in encoder.encode(images, "jpeg", params):
+                    path = next(paths)
+                    if data is None:
+                        raise RuntimeError(f"failed to encode frame {path}")
+                    with open(path, 'wb') as f:
+                        f.write(data)
+            logging.info("Use NVDEC and nvJPEG for video slice.")
+            return True
+        except Exception as e:
+            logging.warning(f"GPU video slice failed, fall back to CPU: {e}")
+            return False
+
+    def _slice_with_ffmpeg(self, path_prefix):
+        """
+        使用 ffmpeg 的 image2 输出把视频拆分为 JPEG 图像，解码与编码都在 ffmpeg 内部多线程完成。
+        文件名与 OpenCV 路径一致，帧计数从 0 开始。
+        返回值: 成功返回 True，否则返回 False。
+        """
+        # ffmpeg 输出文件名是 printf 风格的模板，路径中原有的 % 需要转义
+        pattern = path_prefix.replace("%", "%%") + "%d.jpg"
+        command = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", self.filename,
+                   "-vsync", "0", "-qscale:v", "3", "-threads", "0", "-start_number", "0", pattern]
+        result = subprocess.run(command, capture_output=True, text=True, errors="replace")
+        if result.returncode != 0:
+            logging.warning(f"ffmpeg failed to slice the record, fall back to OpenCV: {result.stderr.strip()}")
+            return False
+        return True
+
+    def _slice_with_opencv(self, path_prefix):
+        """
+        使用 OpenCV 逐帧解码视频，JPEG 编码与写盘交给线程池并行处理。
+        返回值: 成功返回 True，否则返回 False。
+        """
+        frame_capture = None    # 初始化视频帧捕获对象
+        # 按帧计数依次生成的图像路径
+        paths = frame_paths(path_prefix)
+        # 限制已提交但尚未完成的帧数，避免解码快于编码时内存无限增长
+        pending = threading.Semaphore(SLICE_MAX_PENDING)
+        # 整个切片过程共用一个 JPEG 编码器
+        jpeg_encoder = create_jpeg_encoder()
+
+        def save_frame(path, frame):
+            try:
+                save_jpeg(path, frame, jpeg_encoder)
+            except Exception as err:
+                logging.error(f"Failed to save frame {path}: {err}")
+            finally:
+                pending.release()
+
         try:
             # 打开视频文件
-            frame_capture = cv2.VideoCapture(self.filename)
+            frame_capture = open_video_reader(self.filename)
             if not frame_capture.isOpened():
                 logging.error("Failed to open video file.")
                 sys.exit(1)
-            # 逐帧读取并保存视频帧
-            while True:
-                ret, frame = frame_capture.read()
-                if ret:
-                    # 构造并保存当前帧的图像文件
-                    video_frame = os.path.join(sub_record_dir_path, f"{self.record_name}_frame_count_{frame_count}.jpg")
-                    cv2.imwrite(video_frame, frame)
-                    frame_count += 1
-                else:
-                    # 遇到视频末尾，退出循环
-                    break
-            logging.info(f"Record has been sliced: {sub_record_dir_path}")
+            # 逐帧读取视频帧，JPEG 编码与写盘交给线程池并行处理
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                while True:
+                    ret, frame = frame_capture.read()
+                    if not ret:
+                        # 遇到视频末尾，退出循环
+                        break
+                    pending.acquire()
+                    executor.submit(save_frame, next(paths), frame)
+            return True
         except Exception as e:
             logging.error(f"An error occurred during processing: {e}")
+            return False
         finally:
             # 确保释放视频文件的资源
             frame_capture.release()
@@ -383,9 +1083,7 @@ if __name__ == "__main__":
     id = show_and_select_camera()
     my_camera = USBRecord(device_index=id, frame_resolution=(1280, 720), frame_rate=60)
     my_camera.open_record_camera()
-    time.sleep(1)
     my_camera.show_live_camera()
-    time.sleep(1)
     video_thread = start_thread(my_camera.start_record, args=(path, "直播切台", 1, 60))     # 录像起进程（路径，计数，录像超时时间）
     time.sleep(3)
     my_camera.start_time_mark()     # enable 时间戳，视频开始左上角记录时间戳，从 0 开始 HH:MM:SS.000